@@ -1,37 +1,169 @@
 """Main agent for routing and handling user queries."""
 
+import asyncio
+import re
+from typing import Any, Awaitable, Callable, Dict, Optional
+
 import httpx
+import orjson
+from cachetools import TTLCache
 from app.tools.math_tool import MathTool
 from app.tools.weather_tool import WeatherTool
 from app.tools.general_tool import GeneralTool
 from app.models import ToolResult
 from app.logging_config import logger
-from app import config
+from app.config import settings
+
+# System prompt for the combined routing + answering call
+ROUTING_SYSTEM_PROMPT = (
+    "You are a helpful AI assistant with access to tools. "
+    "For mathematical calculations, call evaluate_math with a valid Python "
+    "arithmetic expression (use ** for exponentiation). "
+    "For weather information, forecasts, temperature or conditions, call "
+    "get_weather. For anything else, answer directly with a clear, "
+    "accurate, and helpful response. Be concise but informative."
+)
+
+# OpenAI-style tool schemas offered to the LLM
+ROUTING_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "evaluate_math",
+            "description": (
+                "Evaluate a mathematical calculation, equation or "
+                "arithmetic operation"
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "expression": {
+                        "type": "string",
+                        "description": "Python arithmetic expression, e.g. 5+3",
+                    },
+                },
+                "required": ["expression"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "description": "Get current weather information for a location",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "location": {
+                        "type": "string",
+                        "description": "City or region name",
+                    },
+                },
+                "required": ["location"],
+            },
+        },
+    },
+]
 
 
 class MainAgent:
     """Main agent that routes queries to appropriate tools."""
 
-    def __init__(self):
-        """Initialize the main agent with available tools."""
-        self.math_tool = MathTool()
-        self.weather_tool = WeatherTool()
-        self.general_tool = GeneralTool()
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initialize the main agent with available tools.
+
+        Args:
+            client: Shared HTTP client used for all outbound calls
+        """
+        # LLM client for routing, shared with the tools
+        self.llm_client = client
 
-        # LLM client for routing
-        self.llm_client = httpx.AsyncClient(timeout=config.AGENT_TIMEOUT)
+        # Tools are built on first use
+        self._math_tool: Optional[MathTool] = None
+        self._weather_tool: Optional[WeatherTool] = None
+        self._general_tool: Optional[GeneralTool] = None
 
-        # Tool mapping
-        self.tools = {
-            "math": self.math_tool,
-            "weather": self.weather_tool,
-            "general": self.general_tool,
+        # Execute entry points by tool name. Each starts as a stub that
+        # builds its tool; the property then swaps in the bound method, so
+        # later calls are one dict lookup and a direct call
+        self._dispatch: Dict[str, Callable[[str], Awaitable[str]]] = {
+            "math": lambda query: self.math_tool.execute(query),
+            "weather": lambda query: self.weather_tool.execute(query),
+            "general": lambda query: self.general_tool.execute(query),
         }
 
+        # Cheap pre-classifier rules that skip the LLM entirely
+        self._math_re = re.compile(r"[\d\.]+\s*[\+\-\*/x×÷]\s*[\d\.]")
+        self._weather_re = re.compile(r"\b(weather|forecast)\b", re.I)
+        # Words like "temperature" or "rain" only count as weather queries
+        # with a time or place ("rain tomorrow", "temperature in Paris")
+        self._weather_hint_re = re.compile(
+            r"\b(temperature|rain(ing|y)?|humid(ity)?|snow(ing)?|sunny)\b",
+            re.I,
+        )
+        self._weather_context_re = re.compile(
+            r"\b(?:(?i:today|tonight|tomorrow|outside|right now|"
+            r"this (?:morning|afternoon|evening|week(?:end)?))"
+            r"|(?i:in|at)\s+[A-Z])"
+        )
+
+        # LLM routing decisions keyed by normalized query
+        self._route_cache = TTLCache(maxsize=10_000, ttl=3600)
+        self._route_inflight: Dict[str, asyncio.Future] = {}
+
+        # Static parts of the routing request
+        self._url = f"{settings.LM_STUDIO_BASE_URL}/chat/completions"
+        self._route_headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {settings.LM_STUDIO_API_KEY}",
+        }
+        self._route_system_message = {
+            "role": "system",
+            "content": ROUTING_SYSTEM_PROMPT,
+        }
+        self._route_payload_base = {
+            "model": settings.LM_STUDIO_MODEL,
+            "tools": ROUTING_TOOLS,
+            "tool_choice": "auto",
+            "temperature": 0.1,
+            "max_tokens": 500,
+            "stream": True,
+            "cache_prompt": True,  # Reuse the KV cache for the static prefix
+        }
+
+    @property
+    def math_tool(self) -> MathTool:
+        """Math tool, created on first access."""
+        if self._math_tool is None:
+            self._math_tool = MathTool(client=self.llm_client)
+            self._dispatch["math"] = self._math_tool.execute
+        return self._math_tool
+
+    @property
+    def weather_tool(self) -> WeatherTool:
+        """Weather tool, created on first access."""
+        if self._weather_tool is None:
+            self._weather_tool = WeatherTool(client=self.llm_client)
+            self._dispatch["weather"] = self._weather_tool.execute
+        return self._weather_tool
+
+    @property
+    def general_tool(self) -> GeneralTool:
+        """General tool, created on first access."""
+        if self._general_tool is None:
+            self._general_tool = GeneralTool(client=self.llm_client)
+            self._dispatch["general"] = self._general_tool.execute
+        return self._general_tool
+
     async def route_query(self, query: str) -> ToolResult:
         """
         Route a user query to the appropriate tool.
 
+        A single function-calling request both picks the tool and, for
+        general queries, produces the answer. Math expressions returned by
+        the LLM are evaluated locally without a second LLM call.
+
         Args:
             query: The user's query
 
@@ -39,89 +171,226 @@ class MainAgent:
             ToolResult with the response
         """
         try:
-            # Route the query to determine which tool to use
-            tool_name = await self._route_with_llm(query)
+            rule_tool = self._route_with_rules(query)
+            if rule_tool:
+                logger.info("Query routed to tool by rules: %s", rule_tool)
+                return await self.execute_query(query, rule_tool)
+
+            message = await self._route_with_tools(query)
+            if message is None:
+                logger.warning("LLM routing failed, defaulting to general tool")
+                return await self.execute_query(query, "general")
+
+            tool_calls = message.get("tool_calls") or []
+            if tool_calls:
+                function = tool_calls[0].get("function") or {}
+                name = function.get("name")
+
+                if name == "evaluate_math":
+                    logger.info("Query routed to tool: math")
+                    expression = self._parse_expression(
+                        function.get("arguments")
+                    )
+                    if expression is None:
+                        # Malformed arguments; let the tool parse the query
+                        return await self.execute_query(query, "math")
+
+                    result = self.math_tool.evaluate_expression(expression)
+                    return ToolResult(
+                        tool_name="math", result=result, success=True
+                    )
+
+                if name == "get_weather":
+                    logger.info("Query routed to tool: weather")
+                    return await self.execute_query(query, "weather")
 
-            # Execute the query with the selected tool
-            return await self.execute_query(query, tool_name)
+            content = (message.get("content") or "").strip()
+            if content:
+                logger.info("Query routed to tool: general")
+                return ToolResult(
+                    tool_name="general", result=content, success=True
+                )
+
+            # Empty answer, let the general tool try on its own
+            return await self.execute_query(query, "general")
 
         except Exception as e:
-            logger.error(f"Error in route_query: {e}")
+            logger.error("Error in route_query: %s", e)
             return ToolResult(
                 tool_name="error",
                 result=f"An error occurred while processing your query: {str(e)}",
                 success=False,
             )
 
-    async def _route_with_llm(self, query: str) -> str:
+    def _route_with_rules(self, query: str) -> Optional[str]:
         """
-        Use LLM to determine routing.
+        Classify obvious queries without calling the LLM.
 
         Args:
             query: The user query to analyze
 
         Returns:
-            The name of the appropriate tool
+            The tool name, or None if the rules are inconclusive
         """
-        routing_prompt = f"""
-You are a query router. Analyze the following query and determine which \
-tool should handle it.
+        # Weather first: dates, ranges and phone numbers look like
+        # arithmetic, so "weather on 10/14" must not reach the math rule
+        if self._weather_re.search(query) or (
+            self._weather_hint_re.search(query)
+            and self._weather_context_re.search(query)
+        ):
+            return "weather"
 
-Available tools:
-- math: For mathematical calculations, equations, arithmetic operations
-- weather: For weather information, forecasts, temperature, conditions
-- general: For general questions, conversations, explanations, and \
-anything else
+        # Only pure arithmetic counts; "what happened on 9/11?" still
+        # matches the pattern, so leave anything else to the LLM
+        if self._math_re.search(query) and self.math_tool.parse_expression(
+            query
+        ):
+            return "math"
+        return None
 
-Query: "{query}"
+    @staticmethod
+    def _parse_expression(arguments: Optional[str]) -> Optional[str]:
+        """
+        Extract the expression from ``evaluate_math`` call arguments.
 
-Respond with ONLY the tool name (math, weather, or general). \
-No explanation needed.
-"""
+        Args:
+            arguments: Raw JSON arguments streamed by the LLM
 
+        Returns:
+            The expression, or None if the arguments are truncated or
+            malformed
+        """
         try:
-            # Call LLM directly for routing
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {config.LM_STUDIO_API_KEY}",
-            }
+            expression = orjson.loads(arguments or "{}").get("expression")
+        except (orjson.JSONDecodeError, AttributeError):
+            return None
+
+        if not isinstance(expression, str) or not expression.strip():
+            return None
+        return expression
 
+    async def _route_with_tools(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Send the query to the LLM with the tool schemas attached.
+
+        Args:
+            query: The user query to analyze
+
+        Returns:
+            The assistant message (with either ``tool_calls`` or ``content``)
+            or None if the call failed
+        """
+        cache_key = query.strip().lower()
+        cached = self._route_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent identical queries onto one in-flight request
+        pending = self._route_inflight.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._request_route(query, cache_key)
+            )
+            self._route_inflight[cache_key] = pending
+            pending.add_done_callback(
+                lambda _: self._route_inflight.pop(cache_key, None)
+            )
+
+        return await asyncio.shield(pending)
+
+    async def _request_route(
+        self, query: str, cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Stream the function-calling request and cache a successful reply.
+
+        Reading stops early once the LLM picks a tool that needs no
+        arguments, closing the stream instead of waiting for the full body.
+
+        Args:
+            query: The user query to analyze
+            cache_key: Normalized query used for the routing cache
+
+        Returns:
+            The assistant message or None if the call failed
+        """
+        try:
             payload = {
-                "model": config.LM_STUDIO_MODEL,
-                "messages": [{"role": "user", "content": routing_prompt}],
-                "temperature": 0.0,
-                "max_tokens": 10,
-                "stream": False,
+                **self._route_payload_base,
+                "messages": [
+                    self._route_system_message,
+                    {"role": "user", "content": query},
+                ],
             }
 
-            response = await self.llm_client.post(
-                f"{config.LM_STUDIO_BASE_URL}/chat/completions",
-                headers=headers,
-                json=payload,
-            )
+            content_parts = []
+            tool_name = None
+            argument_parts = []
+
+            async with self.llm_client.stream(
+                "POST",
+                self._url,
+                headers=self._route_headers,
+                content=orjson.dumps(payload),
+            ) as response:
+                if response.status_code != 200:
+                    return None
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    chunk = line[len("data: "):]
+                    if chunk == "[DONE]":
+                        break
+
+                    choices = orjson.loads(chunk).get("choices")
+                    if not choices:
+                        continue
+                    delta = choices[0].get("delta") or {}
 
-            if response.status_code == 200:
-                data = response.json()
+                    if delta.get("content"):
+                        content_parts.append(delta["content"])
+                    for call in delta.get("tool_calls") or []:
+                        function = call.get("function") or {}
+                        if function.get("name"):
+                            tool_name = function["name"]
+                        if function.get("arguments"):
+                            argument_parts.append(function["arguments"])
+
+                    # The weather tool needs nothing else from the router,
+                    # so stop decoding as soon as it has been chosen
+                    if tool_name == "get_weather":
+                        break
+
+            if tool_name:
+                arguments = "".join(argument_parts)
+                message = {
+                    "tool_calls": [
+                        {
+                            "function": {
+                                "name": tool_name,
+                                "arguments": arguments,
+                            }
+                        }
+                    ]
+                }
                 if (
-                    data.get("choices")
-                    and len(data["choices"]) > 0
-                    and data["choices"][0].get("message")
+                    tool_name == "evaluate_math"
+                    and self._parse_expression(arguments) is None
                 ):
-                    content = data["choices"][0]["message"]["content"]
-                    tool_name = content.strip().lower()
-
-                    # Validate tool name
-                    if tool_name in self.tools:
-                        logger.info(f"Query routed to tool: {tool_name}")
-                        return tool_name
+                    # Don't pin a broken reply in the cache for an hour
+                    return message
+            elif content_parts:
+                message = {"content": "".join(content_parts)}
+            else:
+                return None
 
-            # Fallback to general if routing fails
-            logger.warning("LLM routing failed, defaulting to general tool")
-            return "general"
+            self._route_cache[cache_key] = message
+            return message
 
         except Exception as e:
-            logger.error(f"Error in LLM routing: {e}")
-            return "general"
+            logger.error("Error in LLM routing: %s", e)
+            return None
 
     async def execute_query(self, query: str, tool_name: str) -> ToolResult:
         """
@@ -136,19 +405,19 @@ No explanation needed.
         """
         try:
             # Get the appropriate tool
-            tool = self.tools.get(tool_name)
-            if not tool:
+            execute = self._dispatch.get(tool_name)
+            if not execute:
                 raise ValueError(f"Unknown tool: {tool_name}")
 
             # Execute the tool
-            result = await tool.execute(query)
+            result = await execute(query)
 
-            logger.info(f"Tool {tool_name} executed successfully")
+            logger.info("Tool %s executed successfully", tool_name)
 
             return ToolResult(tool_name=tool_name, result=result, success=True)
 
         except Exception as e:
-            logger.error(f"Error executing {tool_name}: {e}")
+            logger.error("Error executing %s: %s", tool_name, e)
             return ToolResult(
                 tool_name=tool_name,
                 result=f"Error: {str(e)}",
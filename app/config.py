@@ -1,6 +1,8 @@
 """Configuration management for the AI Agent Backend."""
 
 import os
+from dataclasses import dataclass, field
+from typing import Optional
 
 
 def get_env_bool(key: str, default: bool = False) -> bool:
@@ -9,22 +11,41 @@ def get_env_bool(key: str, default: bool = False) -> bool:
     return value in ("true", "1", "yes", "on")
 
 
-# FastAPI settings
-APP_NAME = os.getenv("APP_NAME", "AI Agent Backend")
-APP_VERSION = os.getenv("APP_VERSION", "1.0.0")
-DEBUG = get_env_bool("DEBUG", False)
+def _env(key: str, default=None):
+    """Build a dataclass field that reads an environment variable."""
+    return field(default_factory=lambda: os.getenv(key, default))
 
-# LM Studio settings
-LM_STUDIO_BASE_URL = os.getenv("LM_STUDIO_BASE_URL", "http://localhost:1234/v1")
-LM_STUDIO_MODEL = os.getenv("LM_STUDIO_MODEL", "local-model")
-LM_STUDIO_API_KEY = os.getenv("LM_STUDIO_API_KEY", "lm-studio")
 
-# Weather API settings
-OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
-OPENWEATHER_BASE_URL = "https://api.openweathermap.org/data/2.5"
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings, read from the environment once."""
 
-# Default location when no location specified
-DEFAULT_LOCATION = os.getenv("DEFAULT_LOCATION", "Jakarta")
+    # FastAPI settings
+    APP_NAME: str = _env("APP_NAME", "AI Agent Backend")
+    APP_VERSION: str = _env("APP_VERSION", "1.0.0")
+    DEBUG: bool = field(default_factory=lambda: get_env_bool("DEBUG", False))
 
-# Agent settings
-AGENT_TIMEOUT = int(os.getenv("AGENT_TIMEOUT", "30"))
+    # LM Studio settings
+    LM_STUDIO_BASE_URL: str = _env(
+        "LM_STUDIO_BASE_URL", "http://localhost:1234/v1"
+    )
+    LM_STUDIO_MODEL: str = _env("LM_STUDIO_MODEL", "local-model")
+    LM_STUDIO_API_KEY: str = _env("LM_STUDIO_API_KEY", "lm-studio")
+
+    # Weather API settings
+    OPENWEATHER_API_KEY: Optional[str] = _env("OPENWEATHER_API_KEY")
+    OPENWEATHER_BASE_URL: str = "https://api.openweathermap.org/data/2.5"
+
+    # Default location when no location specified
+    DEFAULT_LOCATION: str = _env("DEFAULT_LOCATION", "Jakarta")
+
+    # SQLite file for persistent LLM response caching (memory only if unset)
+    LLM_CACHE_PATH: Optional[str] = _env("LLM_CACHE_PATH")
+
+    # Agent settings
+    AGENT_TIMEOUT: int = field(
+        default_factory=lambda: int(os.getenv("AGENT_TIMEOUT", "30"))
+    )
+
+
+settings = Settings()
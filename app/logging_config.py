@@ -1,7 +1,10 @@
 """Logging configuration for the AI Agent Backend."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any
 
 
@@ -18,11 +21,23 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
     # Configure logging format
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Records are queued by the caller and written to stdout by a listener
+    # thread, so logging never blocks the event loop on I/O
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(log_format))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
     # Configure logging
     logging.basicConfig(
         level=getattr(logging, level.upper()),
-        format=log_format,
-        handlers=[logging.StreamHandler(sys.stdout)],
+        handlers=[queue_handler],
     )
 
     # Get the root logger
@@ -49,7 +64,7 @@ def log_request_start(query: str) -> Dict[str, Any]:
     Returns:
         Log data dictionary
     """
-    logger.info(f"Processing query: {query}")
+    logger.info("Processing query: %s", query)
     return {"query": query}
 
 
@@ -63,6 +78,8 @@ def log_tool_execution(tool_name: str, duration: float, status: str) -> None:
         status: Execution status (success/error)
     """
     logger.info(
-        f"Tool execution completed: {tool_name} "
-        f"(duration: {duration:.3f}s, status: {status})"
+        "Tool execution completed: %s (duration: %.3fs, status: %s)",
+        tool_name,
+        duration,
+        status,
     )
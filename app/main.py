@@ -1,12 +1,19 @@
 """Main FastAPI application for the AI Agent Backend."""
 
+import asyncio
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
+import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+from .config import settings
 from .agents.main_agent import MainAgent
 from .models import QueryRequest, QueryResponse
 from .logging_config import log_request_start, log_tool_execution
@@ -16,6 +23,42 @@ logger = logging.getLogger(__name__)
 # Global agent instance
 router_agent = None
 
+# Seconds between keep-alive pings; below the pool's keepalive_expiry
+KEEPALIVE_INTERVAL = 20
+
+
+async def _warm_up(client: httpx.AsyncClient) -> None:
+    """Open a keep-alive connection to LM Studio before real traffic."""
+    try:
+        await client.post(
+            f"{settings.LM_STUDIO_BASE_URL}/chat/completions",
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {settings.LM_STUDIO_API_KEY}",
+            },
+            content=orjson.dumps(
+                {
+                    "model": settings.LM_STUDIO_MODEL,
+                    "messages": [{"role": "user", "content": "ok"}],
+                    "max_tokens": 1,
+                }
+            ),
+        )
+    except Exception as e:
+        logger.warning("LM Studio warm-up request failed: %s", e)
+
+
+async def _keepalive_loop(client: httpx.AsyncClient) -> None:
+    """Ping LM Studio periodically so its pooled connection stays open."""
+    url = f"{settings.LM_STUDIO_BASE_URL}/models"
+    headers = {"Authorization": f"Bearer {settings.LM_STUDIO_API_KEY}"}
+    while True:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        try:
+            await client.get(url, headers=headers)
+        except Exception as e:
+            logger.debug("LM Studio keep-alive ping failed: %s", e)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -23,13 +66,37 @@ async def lifespan(app: FastAPI):
     global router_agent
     logger.info("Starting AI Agent Backend...")
 
+    # One pooled client for every LM Studio and OpenWeather call so routing
+    # and tool execution reuse the same keep-alive connections
+    shared_client = httpx.AsyncClient(
+        timeout=settings.AGENT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=60,
+        ),
+        http2=True,
+    )
+
     # Initialize the agent
-    router_agent = MainAgent()
+    router_agent = MainAgent(client=shared_client)
+
+    # Warm LM Studio in the background so a slow or unreachable server
+    # (e.g. still loading the model) never delays startup
+    warmup_task = asyncio.create_task(_warm_up(shared_client))
+    keepalive_task = asyncio.create_task(_keepalive_loop(shared_client))
 
     yield
 
     # Cleanup on shutdown
     logger.info("Shutting down AI Agent Backend...")
+    for task in (warmup_task, keepalive_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await shared_client.aclose()
 
 
 # Create FastAPI app
@@ -38,14 +105,18 @@ app = FastAPI(
     description="An AI agent that routes queries to appropriate tools",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Compress long responses (e.g. verbose general answers)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors."""
-    logger.error(f"Unhandled error: {str(exc)}")
-    return JSONResponse(
+    logger.error("Unhandled error: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -85,18 +156,15 @@ async def process_query(request: QueryRequest) -> QueryResponse:
     if not router_agent:
         raise HTTPException(status_code=503, detail="Agent not initialized")
 
+    start_ns = None
     try:
         # Log the request
         log_request_start(request.query)
 
         # Execute the query
-        import time
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = await router_agent.route_query(request.query)
-        end_time = time.time()
-
-        duration = end_time - start_time
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
 
         # Log successful execution
         log_tool_execution(result.tool_name, duration, "success")
@@ -108,13 +176,27 @@ async def process_query(request: QueryRequest) -> QueryResponse:
         )
 
     except Exception as e:
-        logger.error(f"Error processing query: {str(e)}")
+        logger.error("Error processing query: %s", e)
 
         # Log failed execution
-        if "start_time" in locals():
-            duration = time.time() - start_time
+        if start_ns is not None:
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             log_tool_execution("unknown", duration, "error")
 
         return QueryResponse(
             query=request.query, result=f"Error: {str(e)}", tool_used="error"
         )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # C-accelerated event loop and HTTP parser (shipped with uvicorn[standard])
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
@@ -1,5 +1,6 @@
 """Pydantic models for API requests and responses."""
 
+from dataclasses import dataclass
 from typing import Optional
 from pydantic import BaseModel, Field
 
@@ -23,16 +24,23 @@ class QueryResponse(BaseModel):
     result: str = Field(..., description="The result from the tool execution")
 
 
-class ToolResult(BaseModel):
-    """Result from tool execution."""
+@dataclass(slots=True)
+class ToolResult:
+    """
+    Result from tool execution.
 
-    tool_name: str = Field(
-        ..., description="Name of the tool that was executed"
-    )
-    result: str = Field(..., description="The result from the tool execution")
-    success: bool = Field(
-        ..., description="Whether the execution was successful"
-    )
+    Internal only, so a plain dataclass avoids Pydantic validation on the
+    hot path.
+
+    Attributes:
+        tool_name: Name of the tool that was executed
+        result: The result from the tool execution
+        success: Whether the execution was successful
+    """
+
+    tool_name: str
+    result: str
+    success: bool
 
 
 class ErrorResponse(BaseModel):
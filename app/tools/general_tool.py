@@ -1,17 +1,48 @@
 """General tool for handling conversations and queries using LM Studio."""
 
 import httpx
+import orjson
 from app.tools.base import BaseTool
-from app import config
+from app.logging_config import logger
+from app.config import settings
+
+# System prompt sent with every general query
+GENERAL_SYSTEM_PROMPT = (
+    "You are a helpful AI assistant. Provide clear, accurate, and helpful "
+    "responses to user questions. Be concise but informative."
+)
 
 
 class GeneralTool(BaseTool):
     """Tool for handling general questions and conversations."""
 
-    def __init__(self):
-        """Initialize the general tool."""
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initialize the general tool.
+
+        Args:
+            client: Shared HTTP client used for LM Studio calls
+        """
         super().__init__("general")
-        self.client = httpx.AsyncClient(timeout=config.AGENT_TIMEOUT)
+        self.client = client
+
+        # Static parts of the LM Studio request
+        self._url = f"{settings.LM_STUDIO_BASE_URL}/chat/completions"
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {settings.LM_STUDIO_API_KEY}",
+        }
+        self._system_message = {
+            "role": "system",
+            "content": GENERAL_SYSTEM_PROMPT,
+        }
+        self._payload_base = {
+            "model": settings.LM_STUDIO_MODEL,
+            "temperature": 0.1,
+            "max_tokens": 500,
+            "stream": False,
+            "cache_prompt": True,  # Reuse the KV cache for the static prefix
+        }
 
     async def execute(self, query: str) -> str:
         """
@@ -49,50 +80,29 @@ class GeneralTool(BaseTool):
             The response from LM Studio or None if failed
         """
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {config.LM_STUDIO_API_KEY}",
-            }
-
             payload = {
-                "model": config.LM_STUDIO_MODEL,
+                **self._payload_base,
                 "messages": [
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a helpful AI assistant. Provide clear, "
-                            "accurate, and helpful responses to user "
-                            "questions. Be concise but informative."
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": query,
-                    },
+                    self._system_message,
+                    {"role": "user", "content": query},
                 ],
-                "temperature": 0.1,
-                "max_tokens": 500,
-                "stream": False,
             }
 
             response = await self.client.post(
-                f"{config.LM_STUDIO_BASE_URL}/chat/completions",
-                headers=headers,
-                json=payload,
+                self._url,
+                headers=self._headers,
+                content=orjson.dumps(payload),
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                if (
-                    data.get("choices")
-                    and len(data["choices"]) > 0
-                    and data["choices"][0].get("message")
-                ):
-                    content = data["choices"][0]["message"]["content"]
-                    return content.strip()
+            if response.status_code != 200:
+                return None
 
-            return None
+            data = orjson.loads(response.content)
+            try:
+                return data["choices"][0]["message"]["content"].strip()
+            except (KeyError, IndexError, TypeError, AttributeError):
+                return None
 
         except Exception as e:
-            print(f"Error calling LM Studio: {e}")
+            logger.warning("Error calling LM Studio: %s", e)
             return None
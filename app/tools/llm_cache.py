@@ -0,0 +1,172 @@
+"""Two-tier cache for LM Studio chat completions."""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import orjson
+from cachetools import LRUCache, TTLCache
+
+_LOGGER = logging.getLogger("ai_agent.llm_cache")
+
+# Bump whenever a cached prompt changes so stale answers are not reused.
+# The model name is part of every key, so swapping models never serves
+# answers produced by the previous one (nor can LM Studio reuse its
+# server-side prompt cache across models).
+PROMPT_VERSION = "v2"
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """
+    Build a stable cache key for a chat-completions payload.
+
+    Args:
+        payload: The request payload sent to LM Studio
+
+    Returns:
+        Hex SHA-256 digest of the prompt version, model, messages and
+        temperature
+    """
+    material = {
+        "version": PROMPT_VERSION,
+        "model": payload.get("model"),
+        "messages": payload.get("messages"),
+        "temperature": payload.get("temperature"),
+    }
+    return hashlib.sha256(
+        orjson.dumps(material, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+
+
+class LLMCache:
+    """
+    LLM response cache with an in-memory tier and an optional SQLite tier.
+
+    The memory tier serves hot keys without I/O. When a database path is
+    given, responses are also persisted so they survive restarts. Errors
+    in the persistent tier (e.g. a database locked by another worker) are
+    logged and otherwise ignored, so they never cost an LLM answer.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        maxsize: int = 1024,
+        path: Optional[str] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid, or None to never expire
+            maxsize: Maximum number of entries kept in memory
+            path: SQLite database file for the persistent tier, if any
+        """
+        self.ttl = ttl
+        self._memory = (
+            TTLCache(maxsize=maxsize, ttl=ttl)
+            if ttl is not None
+            else LRUCache(maxsize=maxsize)
+        )
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "key TEXT PRIMARY KEY, response TEXT, "
+                    "created_at REAL, expires_at REAL)"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS llm_cache_expires_at "
+                    "ON llm_cache (expires_at)"
+                )
+                # Drop expired rows so the file does not grow without bound
+                self._db.execute(
+                    "DELETE FROM llm_cache WHERE expires_at <= ?",
+                    (time.time(),),
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                _LOGGER.warning(
+                    "LLM cache database unavailable, using memory only: %s", e
+                )
+                self._db = None
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss."""
+        value = self._memory.get(key)
+        if value is not None or self._db is None:
+            return value
+
+        try:
+            value = await asyncio.to_thread(self._db_get, key)
+        except sqlite3.Error as e:
+            _LOGGER.warning("LLM cache read failed: %s", e)
+            return None
+
+        if value is not None:
+            self._memory[key] = value
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response in both tiers."""
+        self._memory[key] = value
+        if self._db is not None:
+            try:
+                await asyncio.to_thread(self._db_set, key, value)
+            except sqlite3.Error as e:
+                _LOGGER.warning("LLM cache write failed: %s", e)
+
+    async def cached(
+        self, key: str, fn: Callable[[], Awaitable[Optional[str]]]
+    ) -> Optional[str]:
+        """
+        Return the cached response for a key, calling ``fn`` on a miss.
+
+        Args:
+            key: Cache key, usually from ``cache_key``
+            fn: Coroutine factory that performs the LLM call
+
+        Returns:
+            The response, or None if ``fn`` failed (failures are not cached)
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        value = await fn()
+        if value is not None:
+            await self.set(key, value)
+        return value
+
+    def _db_get(self, key: str) -> Optional[str]:
+        """Read a non-expired entry from SQLite."""
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT response FROM llm_cache WHERE key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _db_set(self, key: str, value: str) -> None:
+        """Upsert an entry into SQLite, purging expired rows."""
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(key, response, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, expires_at),
+            )
+            self._db.execute(
+                "DELETE FROM llm_cache WHERE expires_at <= ?", (now,)
+            )
+            self._db.commit()
@@ -2,16 +2,88 @@
 
 import ast
 import operator
+import re
+from functools import lru_cache
+from typing import Optional
+
 import httpx
+import orjson
 from app.tools.base import BaseTool
-from app import config
+from app.logging_config import logger
+from app.config import settings
+
+# Returned by MathTool._safe_eval for expressions it refuses to evaluate
+_INVALID = object()
+
+# Static parts of the expression construction prompt
+_EXPRESSION_PROMPT_PREFIX = """
+You are a math expression constructor. Convert the following natural \
+language query into a valid Python mathematical expression.
+
+Rules:
+1. Use standard Python operators: +, -, *, /, **, (), etc.
+2. Only output the mathematical expression, nothing else
+3. Do not include any text, explanations, or formatting
+4. If no math is found, return empty string
+5. Use ** for exponentiation (not ^)
+6. Ensure proper operator precedence with parentheses if needed
+
+Examples:
+- "what is 5 plus 3" → "5+3"
+- "calculate 42 times 7" → "42*7"  
+- "what is 2 to the power of 8" → "2**8"
+- "divide 100 by 4" → "100/4"
+- "what is (10 plus 5) times 3 minus 8" → "(10+5)*3-8"
+
+Query: \""""
+_EXPRESSION_PROMPT_SUFFIX = """"
+
+Mathematical expression:"""
 
 
 class MathTool(BaseTool):
     """Tool for performing mathematical calculations."""
 
-    def __init__(self):
-        """Initialize the math tool."""
+    # Natural language operator phrases rewritten before local parsing
+    _NL_MAP = {
+        "plus": "+",
+        "minus": "-",
+        "times": "*",
+        "multiplied by": "*",
+        "divided by": "/",
+        "over": "/",
+        "to the power of": "**",
+        "squared": "**2",
+        "cubed": "**3",
+    }
+    _NL_PATTERN = re.compile(
+        r"\b(?:"
+        + "|".join(
+            map(re.escape, sorted(_NL_MAP, key=len, reverse=True))
+        )
+        + r")\b"
+    )
+    _NON_MATH_CHARS = re.compile(r"[^0-9+\-*/(). ]")
+    # Words the local parser may discard; any other word or symbol
+    # (function names, exponents, "^", "%", ...) sends the query to the LLM
+    _FILLER_WORDS = frozenset(
+        {
+            "what", "what's", "whats", "is", "are", "calculate", "compute",
+            "evaluate", "solve", "find", "please", "the", "value", "of",
+            "answer", "result", "equals", "equal", "how", "much", "tell",
+            "me", "can", "you", "i", "need", "to", "for", "my", "homework",
+        }
+    )
+    _WORD = re.compile(r"[a-z]+(?:'[a-z]+)?")
+    _VALID_EXPRESSION = re.compile(r"(?=.*\d)(?=.*[+\-*/])[0-9+\-*/(). ]+")
+
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initialize the math tool.
+
+        Args:
+            client: Shared HTTP client used for LM Studio calls
+        """
         super().__init__("math")
 
         # Safe operators for mathematical expressions
@@ -25,8 +97,23 @@ class MathTool(BaseTool):
             ast.USub: operator.neg,
         }
 
+        # Validated, compiled expressions keyed by expression string
+        self._compile = lru_cache(maxsize=4096)(self._compile_expression)
+
         # LLM client for expression construction
-        self.llm_client = httpx.AsyncClient(timeout=config.AGENT_TIMEOUT)
+        self.llm_client = client
+        self._url = f"{settings.LM_STUDIO_BASE_URL}/chat/completions"
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {settings.LM_STUDIO_API_KEY}",
+        }
+        self._expression_payload_base = {
+            "model": settings.LM_STUDIO_MODEL,
+            "temperature": 0.0,
+            "max_tokens": 100,
+            "stream": False,
+            "cache_prompt": True,  # Reuse the KV cache for the static prefix
+        }
 
     async def execute(self, query: str) -> str:
         """
@@ -39,8 +126,32 @@ class MathTool(BaseTool):
             The calculation result as a string
         """
         try:
+            # Try to parse the query locally before asking the LLM
+            candidate = self.parse_expression(query)
+            if candidate is not None:
+                result = self._safe_eval(candidate)
+                if result is not _INVALID:
+                    return self._format_result(candidate, result)
+
             # Use LLM to construct mathematical expression from the query
             expression = await self._construct_expression_with_llm(query)
+            return self.evaluate_expression(expression)
+
+        except Exception as e:
+            return f"Error calculating: {str(e)}"
+
+    def evaluate_expression(self, expression: str) -> str:
+        """
+        Evaluate an already constructed mathematical expression.
+
+        Args:
+            expression: Python arithmetic expression, e.g. "5+3"
+
+        Returns:
+            The calculation result as a string
+        """
+        try:
+            expression = (expression or "").strip("\"'` \n\t")
 
             if not expression:
                 return (
@@ -51,88 +162,100 @@ class MathTool(BaseTool):
             # Evaluate the expression safely
             result = self._safe_eval(expression)
 
-            if result is None:
+            if result is _INVALID:
                 return (
                     f"I couldn't evaluate the expression: {expression}. "
                     "Please check if it's a valid mathematical expression."
                 )
 
-            # Format the result nicely
-            if isinstance(result, float) and result.is_integer():
-                result = int(result)
-
-            return f"{expression} = {result}"
+            return self._format_result(expression, result)
 
         except Exception as e:
             return f"Error calculating: {str(e)}"
 
-    async def _construct_expression_with_llm(self, query: str) -> str:
-        """Use LLM to construct a mathematical expression from natural language."""
-        prompt = f"""
-You are a math expression constructor. Convert the following natural \
-language query into a valid Python mathematical expression.
+    def _format_result(self, expression: str, result) -> str:
+        """Format an evaluated expression and its result nicely."""
+        if isinstance(result, float) and result.is_integer():
+            result = int(result)
 
-Rules:
-1. Use standard Python operators: +, -, *, /, **, (), etc.
-2. Only output the mathematical expression, nothing else
-3. Do not include any text, explanations, or formatting
-4. If no math is found, return empty string
-5. Use ** for exponentiation (not ^)
-6. Ensure proper operator precedence with parentheses if needed
+        return f"{expression} = {result}"
 
-Examples:
-- "what is 5 plus 3" → "5+3"
-- "calculate 42 times 7" → "42*7"  
-- "what is 2 to the power of 8" → "2**8"
-- "divide 100 by 4" → "100/4"
-- "what is (10 plus 5) times 3 minus 8" → "(10+5)*3-8"
+    def parse_expression(self, query: str) -> Optional[str]:
+        """
+        Parse a query that is plain arithmetic without calling the LLM.
+
+        Args:
+            query: The user's query
+
+        Returns:
+            The expression, or None if the query is more than arithmetic
+            wrapped in filler words
+        """
+        candidate = self._rewrite_natural_language(query)
+        if self._is_valid_math_expression(candidate):
+            return candidate
+        return None
 
-Query: "{query}"
+    def _rewrite_natural_language(self, query: str) -> str:
+        """
+        Rewrite operator phrases and drop filler words.
 
-Mathematical expression:"""
+        Only filler words, whitespace and a trailing "?" are removed; if
+        anything else is left that isn't math, the query is not parsed
+        locally, since silently dropping it would change the expression.
+
+        Args:
+            query: The user's query
+
+        Returns:
+            Candidate expression, e.g. "what is 5 plus 3?" -> "5 + 3", or
+            an empty string if the query can't be parsed locally
+        """
+        candidate = self._NL_PATTERN.sub(
+            lambda m: self._NL_MAP[m.group(0)], query.lower()
+        )
+        candidate = self._WORD.sub(
+            lambda m: " " if m.group(0) in self._FILLER_WORDS else m.group(0),
+            candidate,
+        )
+        candidate = " ".join(candidate.split()).rstrip("?").rstrip()
+
+        if self._NON_MATH_CHARS.search(candidate):
+            return ""
+        return candidate
+
+    async def _construct_expression_with_llm(self, query: str) -> str:
+        """Use LLM to construct a mathematical expression from natural language."""
+        prompt = _EXPRESSION_PROMPT_PREFIX + query + _EXPRESSION_PROMPT_SUFFIX
 
         try:
             # Call LLM directly
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {config.LM_STUDIO_API_KEY}",
-            }
-
             payload = {
-                "model": config.LM_STUDIO_MODEL,
+                **self._expression_payload_base,
                 "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.0,
-                "max_tokens": 100,
-                "stream": False,
             }
 
             response = await self.llm_client.post(
-                f"{config.LM_STUDIO_BASE_URL}/chat/completions",
-                headers=headers,
-                json=payload,
+                self._url,
+                headers=self._headers,
+                content=orjson.dumps(payload),
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                if (
-                    data.get("choices")
-                    and len(data["choices"]) > 0
-                    and data["choices"][0].get("message")
-                ):
-                    content = data["choices"][0]["message"]["content"]
-                    expression = content.strip()
-
-                    # Clean up the expression - remove quotes or extra text
-                    expression = expression.strip("\"'` \n\t")
+            if response.status_code != 200:
+                return ""
 
-                    # Validate it looks like a math expression
-                    if self._is_valid_math_expression(expression):
-                        return expression
+            data = orjson.loads(response.content)
+            try:
+                content = data["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                return ""
 
-            return ""
+            # Clean up the expression - remove quotes or extra text
+            # (validation happens once, in _safe_eval)
+            return (content or "").strip().strip("\"'` \n\t")
 
         except Exception as e:
-            print(f"Error in LLM math construction: {e}")
+            logger.warning("Error in LLM math construction: %s", e)
             return ""
 
     def _is_valid_math_expression(self, expression: str) -> bool:
@@ -140,44 +263,48 @@ Mathematical expression:"""
         if not expression:
             return False
 
-        # Should contain only math characters
-        allowed_chars = set("0123456789+-*/().** ")
-        if not all(c in allowed_chars for c in expression):
-            return False
-
-        # Should contain at least one number and one operator
-        has_number = any(c.isdigit() for c in expression)
-        has_operator = any(
-            op in expression for op in ["+", "-", "*", "/", "**"]
-        )
-
-        return has_number and has_operator
+        # Only math characters, with at least one number and one operator
+        return self._VALID_EXPRESSION.fullmatch(expression) is not None
 
     def _safe_eval(self, expression: str):
-        """Safely evaluate mathematical expression using AST."""
+        """
+        Safely evaluate mathematical expression using cached bytecode.
+
+        Returns:
+            The numeric result, or ``_INVALID`` if the expression doesn't
+            parse or uses anything other than whitelisted operations
+        """
+        # CPython constant-folds these pure arithmetic expressions at compile
+        # time, so a cached code object is already evaluated in C. numexpr is
+        # deliberately not used: it works in int64/float64 and would silently
+        # overflow or round results that Python ints handle exactly.
         try:
-            # Parse the expression into an AST
-            node = ast.parse(expression, mode="eval")
-            return self._eval_node(node.body)
+            code = self._compile(expression)
+            return eval(code, {"__builtins__": {}}, {})
         except (ValueError, SyntaxError, TypeError):
-            return None
-
-    def _eval_node(self, node):
-        """Recursively evaluate AST nodes."""
-        if isinstance(node, ast.Constant):  # For Python 3.8+
-            return node.value
-        elif isinstance(node, ast.Num):  # For older Python versions
-            return node.n
+            return _INVALID
+
+    def _compile_expression(self, expression: str):
+        """Validate the expression's AST once and compile it to bytecode."""
+        node = ast.parse(expression, mode="eval")
+        self._validate_node(node.body)
+        return compile(node, "<math>", "eval")
+
+    def _validate_node(self, node) -> None:
+        """Recursively check that AST nodes only use whitelisted operations."""
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, (int, float)) and not isinstance(
+                node.value, bool
+            ):
+                return
         elif isinstance(node, ast.BinOp):
-            left = self._eval_node(node.left)
-            right = self._eval_node(node.right)
-            op = self.operators.get(type(node.op))
-            if op:
-                return op(left, right)
+            if type(node.op) in self.operators:
+                self._validate_node(node.left)
+                self._validate_node(node.right)
+                return
         elif isinstance(node, ast.UnaryOp):
-            operand = self._eval_node(node.operand)
-            op = self.operators.get(type(node.op))
-            if op:
-                return op(operand)
+            if type(node.op) in self.operators:
+                self._validate_node(node.operand)
+                return
 
         raise ValueError(f"Unsupported operation: {type(node)}")
@@ -1,28 +1,171 @@
 """Weather tool for weather-related queries using OpenWeather API."""
 
+import asyncio
+import logging
 import re
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
 from app.tools.base import BaseTool
-from app import config
+from app.tools.llm_cache import LLMCache, cache_key
+from app.config import settings
+
+_LOGGER = logging.getLogger("ai_agent.weather")
+
+# Common weather words stripped by the manual location extractor
+_WEATHER_WORDS_RE = re.compile(
+    r"\b(?:weather|temperature|forecast|climate|what's|what is|how's|"
+    r"how is|the|in|at|for|today|tomorrow|like)\b",
+    re.IGNORECASE,
+)
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# Bare "what's the weather?" style queries: no location for the LLM to
+# find and nothing to tailor, so they are answered from the template
+_TRIVIAL_QUERY_RE = re.compile(
+    r"^\s*(?:what'?s|how'?s)\s+(?:the\s+)?(?:weather|temperature)\s*\??\s*$",
+    re.IGNORECASE,
+)
+
+# While a lookup for a city with a known OpenWeather id is in flight,
+# further ones are collected for this many seconds and sent as one /group
+# request (max 20 ids each); a lookup with nothing in flight goes out at once
+_BATCH_WINDOW = 0.05
+_GROUP_SIZE = 20
+
+# Cities found in a query without asking the LLM. Queries naming one of
+# these skip the location-extraction round-trip entirely.
+_KNOWN_CITIES = frozenset(
+    {
+        "amsterdam", "athens", "atlanta", "auckland", "austin", "bangkok",
+        "barcelona", "beijing", "berlin", "bogota", "boston", "brisbane",
+        "brussels", "budapest", "buenos aires", "cairo", "calgary",
+        "cape town", "chicago", "copenhagen", "dallas", "delhi", "denver",
+        "dubai", "dublin", "edinburgh", "frankfurt", "geneva", "hanoi",
+        "helsinki", "ho chi minh city", "hong kong", "houston", "istanbul",
+        "jakarta", "jerusalem", "johannesburg", "karachi", "kuala lumpur",
+        "kyiv", "lagos", "las vegas", "lima", "lisbon", "london",
+        "los angeles", "madrid", "manchester", "manila", "melbourne",
+        "mexico city", "miami", "milan", "montreal", "moscow", "mumbai",
+        "munich", "nairobi", "new delhi", "new york", "new york city", "oslo",
+        "osaka", "paris", "perth", "philadelphia", "phoenix", "prague",
+        "rio de janeiro", "riyadh", "rome", "san diego", "san francisco",
+        "santiago", "sao paulo", "seattle", "seoul", "shanghai", "singapore",
+        "stockholm", "sydney", "taipei", "tehran", "tel aviv", "tokyo",
+        "toronto", "vancouver", "vienna", "warsaw", "washington", "zurich",
+    }
+)
+# Longest names first so "new york city" wins over "new york"
+_KNOWN_CITY_RE = re.compile(
+    r"\b(?:"
+    + "|".join(map(re.escape, sorted(_KNOWN_CITIES, key=len, reverse=True)))
+    + r")\b",
+    re.IGNORECASE,
+)
+
+# System prompts for location extraction and natural language rendering.
+# They are always sent as messages[0] and must stay byte-identical (no
+# interpolation) so LM Studio can reuse their KV cache across requests.
+_EXTRACT_SYSTEM = """Extract the location from a weather query. Reply with JSON: {"location": "<name>"} or {"location": null}.
+- City, country or region only; prefer the city ("Tokyo, Japan" -> "Tokyo")
+- Expand nicknames and abbreviations
+- null if no location is mentioned
+
+Examples:
+- "What's the weather in Paris?" -> {"location": "Paris"}
+- "Weather in NYC" -> {"location": "New York City"}"""
+_SYSTEM_MSG_EXTRACT = {"role": "system", "content": _EXTRACT_SYSTEM}
+
+_NL_SYSTEM = """You are a friendly weather assistant. Answer the user's weather question in a few conversational sentences using the given data.
+- Answer the specific question first
+- Mention only the most relevant details
+- Say if conditions are good or bad for being outside
+Reply with the answer text only, without JSON or formatting.
+
+Example: "It's quite pleasant in Paris right now! 22°C with partly cloudy skies, perfect for a stroll along the Seine." """
+_SYSTEM_MSG_NL = {"role": "system", "content": _NL_SYSTEM}
+
+# Structured output schemas so the LLM always returns parseable JSON
+_EXTRACT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "location",
+        "schema": {
+            "type": "object",
+            "properties": {"location": {"type": ["string", "null"]}},
+            "required": ["location"],
+        },
+    },
+}
 
 
 class WeatherTool(BaseTool):
     """Tool for weather information and forecasts."""
 
-    def __init__(self):
-        """Initialize the weather tool."""
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initialize the weather tool.
+
+        Args:
+            client: Shared HTTP client, pooling both OpenWeather and
+                LM Studio connections
+        """
         super().__init__("weather")
-        self.client = httpx.AsyncClient(timeout=config.AGENT_TIMEOUT)
-        self.openweather_api_key = config.OPENWEATHER_API_KEY
-        self.openweather_base_url = config.OPENWEATHER_BASE_URL
-        self.default_location = config.DEFAULT_LOCATION
+        self.client = client
+        self.openweather_api_key = settings.OPENWEATHER_API_KEY
+        self.openweather_base_url = settings.OPENWEATHER_BASE_URL
+        self.default_location = settings.DEFAULT_LOCATION
 
         # For LLM-based location extraction
-        self.llm_client = httpx.AsyncClient(timeout=config.AGENT_TIMEOUT)
-        self.lm_studio_url = config.LM_STUDIO_BASE_URL
-        self.lm_studio_model = config.LM_STUDIO_MODEL
-        self.lm_studio_api_key = config.LM_STUDIO_API_KEY
+        self.lm_studio_url = settings.LM_STUDIO_BASE_URL
+        self._llm_url = f"{self.lm_studio_url}/chat/completions"
+        self.lm_studio_model = settings.LM_STUDIO_MODEL
+        self.lm_studio_api_key = settings.LM_STUDIO_API_KEY
+
+        # Static parts of the LM Studio requests
+        self._llm_headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.lm_studio_api_key}",
+        }
+        self._extract_payload_base = {
+            "model": self.lm_studio_model,
+            "temperature": 0.0,  # Low temperature for consistent extraction
+            "max_tokens": 100,
+            "stream": False,
+            "response_format": _EXTRACT_RESPONSE_FORMAT,
+            "cache_prompt": True,  # Reuse the KV cache for the static prefix
+        }
+        self._nl_payload_base = {
+            "model": self.lm_studio_model,
+            "temperature": 0.7,  # Higher for more natural responses
+            "max_tokens": 120,
+            "stream": False,
+            "cache_prompt": True,  # Reuse the KV cache for the static prefix
+        }
+
+        # Rendered responses keyed by normalized query; weather data changes
+        # slowly, so repeats within five minutes skip all network calls
+        self._response_cache = TTLCache(maxsize=512, ttl=300)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # OpenWeather data keyed by lower-cased city name
+        self._weather_cache = TTLCache(maxsize=256, ttl=60)
+
+        # City ids learned from /weather responses, used to batch lookups
+        # through /group; pending entries map id -> (city, future)
+        self._city_ids = LRUCache(maxsize=4096)
+        self._batch: Dict[int, Tuple[str, asyncio.Future]] = {}
+        self._batch_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks = set()
+        self._lookups_inflight = 0
+
+        # LLM answers keyed by prompt hash
+        self._location_cache = LLMCache(path=settings.LLM_CACHE_PATH)
+        self._response_llm_cache = LLMCache(
+            ttl=300, path=settings.LLM_CACHE_PATH
+        )
 
     async def execute(self, query: str) -> str:
         """
@@ -34,27 +177,79 @@ class WeatherTool(BaseTool):
         Returns:
             Weather information as a formatted string
         """
-        import logging
-        import time
-
-        logger = logging.getLogger("ai_agent.weather")
-
         if not self.openweather_api_key:
-            logger.error("Weather API key not configured")
+            _LOGGER.error("Weather API key not configured")
             return (
                 "Weather service is not configured. "
                 "Please set the OPENWEATHER_API_KEY environment variable."
             )
 
+        response_key = query.strip().lower()
+        cached = self._response_cache.get(response_key)
+        if cached is not None:
+            _LOGGER.info(
+                "Weather response served from cache",
+                extra={"event": "weather_cache_hit"},
+            )
+            return cached
+
+        # Coalesce concurrent identical queries onto one in-flight lookup
+        pending = self._inflight.get(response_key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._fetch_response(query, response_key)
+            )
+            self._inflight[response_key] = pending
+            pending.add_done_callback(
+                lambda _: self._inflight.pop(response_key, None)
+            )
+
+        return await asyncio.shield(pending)
+
+    async def _fetch_response(self, query: str, response_key: str) -> str:
+        """
+        Look up the weather for a query and cache a successful response.
+
+        Args:
+            query: The user's weather-related query
+            response_key: Normalized query used for the response cache
+
+        Returns:
+            Weather information as a formatted string
+        """
         try:
-            # Extract location using LLM
+            if _TRIVIAL_QUERY_RE.match(query):
+                weather_data = await self._get_weather_by_city(
+                    self.default_location
+                )
+                if weather_data:
+                    response = self._format_weather_response(
+                        weather_data, self.default_location
+                    )
+                    self._response_cache[response_key] = response
+                    return response
+
+            known_city = self._find_known_city(query)
+            guess = known_city or self.default_location
+
             start_time = time.time()
-            location = await self._extract_location_with_llm(query)
+            if known_city:
+                # The query names a known city, so skip the LLM round-trip
+                location = known_city
+                weather_data = await self._get_weather_by_city(location)
+            else:
+                # Prefetch the default location while the LLM extracts one;
+                # it is the answer whenever the query names no place, and
+                # leftover phrasing like "How Hot Is It" would only 404
+                location, weather_data = await asyncio.gather(
+                    self._extract_location_with_llm(query),
+                    self._get_weather_by_city(guess),
+                )
             location_duration = time.time() - start_time
 
             if not location:
                 location = self.default_location
-                logger.info(
+                _LOGGER.info(
                     "Using default location",
                     extra={
                         "location": location,
@@ -62,7 +257,7 @@ class WeatherTool(BaseTool):
                     },
                 )
             else:
-                logger.info(
+                _LOGGER.info(
                     "Location extracted",
                     extra={
                         "location": location,
@@ -72,12 +267,14 @@ class WeatherTool(BaseTool):
                 )
 
             # Get weather data directly using city name
-            api_start = time.time()
-            weather_data = await self._get_weather_by_city(location)
-            api_duration = time.time() - api_start
+            api_duration = location_duration
+            if location.lower() != guess.lower():
+                api_start = time.time()
+                weather_data = await self._get_weather_by_city(location)
+                api_duration = time.time() - api_start
 
             if not weather_data:
-                logger.warning(
+                _LOGGER.warning(
                     "Weather data retrieval failed",
                     extra={
                         "location": location,
@@ -90,7 +287,7 @@ class WeatherTool(BaseTool):
                     "Please check the location name and try again."
                 )
 
-            logger.info(
+            _LOGGER.info(
                 "Weather data retrieved",
                 extra={
                     "location": location,
@@ -107,7 +304,7 @@ class WeatherTool(BaseTool):
             llm_duration = time.time() - llm_start
 
             if natural_response:
-                logger.info(
+                _LOGGER.info(
                     "Natural language conversion completed",
                     extra={
                         "location": location,
@@ -115,21 +312,25 @@ class WeatherTool(BaseTool):
                         "event": "natural_language_converted",
                     },
                 )
+                self._response_cache[response_key] = natural_response
                 return natural_response
             else:
                 # Fallback to technical format if LLM fails
-                logger.warning(
+                _LOGGER.warning(
                     "Natural language conversion failed, using fallback",
                     extra={
                         "location": location,
                         "event": "natural_language_fallback",
                     },
                 )
+                # Not cached, so the next request retries the LLM instead
+                # of serving the degraded answer for the whole TTL
                 return self._format_weather_response(weather_data, location)
 
         except Exception as e:
-            logger.error(
-                "Weather query execution failed",
+            _LOGGER.error(
+                "Weather query execution failed: %s",
+                e,
                 extra={
                     "query": query,
                     "error": str(e),
@@ -149,103 +350,62 @@ class WeatherTool(BaseTool):
             Extracted location or None
         """
         try:
-            # Prepare the prompt for location extraction
-            system_prompt = """You are a location extraction assistant. Your job is to extract the location name from weather-related queries.
-
-Extract the location and respond in JSON format:
-{"location": "location_name"} or {"location": null}
-
-Rules:
-1. Extract only the location name (city, country, or region)
-2. If no location is mentioned, return {"location": null}
-3. Be specific - prefer city names over general regions when possible
-4. Handle variations like "NYC" -> "New York City"
-5. For country+city, prefer just the city: "Tokyo, Japan" -> "Tokyo"
-
-Examples:
-- "What's the weather in Paris?" -> {"location": "Paris"}
-- "How's the weather in New York City today?" -> {"location": "New York City"}
-- "Weather forecast for Tokyo, Japan" -> {"location": "Tokyo"}
-- "Is it raining in London?" -> {"location": "London"}
-- "What's the temperature?" -> {"location": null}
-- "Weather in NYC" -> {"location": "New York City"}
-- "How hot is it in the City of Angels?" -> {"location": "Los Angeles"}"""
-
             user_prompt = (
                 f"Extract the location from this weather query: {query}"
             )
 
-            # Call LM Studio
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.lm_studio_api_key}",
-            }
-
             payload = {
-                "model": self.lm_studio_model,
+                **self._extract_payload_base,
                 "messages": [
-                    {"role": "system", "content": system_prompt},
+                    _SYSTEM_MSG_EXTRACT,
                     {"role": "user", "content": user_prompt},
                 ],
-                "temperature": 0.0,  # Low temperature for consistent extraction
-                "max_tokens": 100,
-                "stream": False,
             }
 
-            response = await self.llm_client.post(
-                f"{self.lm_studio_url}/chat/completions",
-                headers=headers,
-                json=payload,
+            # Deterministic at temperature 0, so cached without expiry
+            llm_response = await self._location_cache.cached(
+                cache_key(payload), lambda: self._chat(payload)
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                if (
-                    data.get("choices")
-                    and len(data["choices"]) > 0
-                    and data["choices"][0].get("message")
-                ):
-
-                    llm_response = data["choices"][0]["message"][
-                        "content"
-                    ].strip()
-
-                    # Parse JSON response
-                    import json
-
-                    try:
-                        location_data = json.loads(llm_response)
-                        extracted_location = location_data.get("location")
-
-                        if (
-                            extracted_location
-                            and extracted_location.lower()
-                            not in ["null", "none"]
-                        ):
-                            return extracted_location
-                        else:
-                            return None
-
-                    except json.JSONDecodeError:
-                        print(f"Invalid JSON from LLM: {llm_response}")
-                        # Try to extract location from non-JSON response as fallback
-                        if llm_response.lower() not in [
-                            "none",
-                            "null",
-                            "unknown",
-                        ]:
-                            return llm_response
-                        return None
+            if llm_response:
+                # Structured output guarantees {"location": string | null}
+                extracted_location = orjson.loads(llm_response).get("location")
+                if extracted_location and extracted_location.lower() not in [
+                    "null",
+                    "none",
+                ]:
+                    return extracted_location
+                return None
 
             # Fallback to manual extraction if LLM fails
-            print("LLM location extraction failed, using fallback")
+            _LOGGER.warning(
+                "LLM location extraction failed, using fallback",
+                extra={"event": "location_extraction_fallback"},
+            )
             return self._extract_location_manual(query)
 
         except Exception as e:
-            print(f"Error in LLM location extraction: {e}")
+            _LOGGER.warning(
+                "LLM location extraction error, using fallback: %s",
+                e,
+                extra={"error": str(e), "event": "location_extraction_error"},
+            )
             # Fallback to manual extraction
             return self._extract_location_manual(query)
 
+    def _find_known_city(self, query: str) -> Optional[str]:
+        """
+        Find a known city named anywhere in the query.
+
+        Args:
+            query: The user's query
+
+        Returns:
+            The title-cased city name, or None if no known city appears
+        """
+        match = _KNOWN_CITY_RE.search(query)
+        return match.group(0).title() if match else None
+
     def _extract_location_manual(self, query: str) -> Optional[str]:
         """
         Fallback manual location extraction.
@@ -256,38 +416,12 @@ Examples:
         Returns:
             Extracted location or None
         """
-        query_lower = query.lower()
-
-        # Remove common weather words
-        weather_words = [
-            "weather",
-            "temperature",
-            "forecast",
-            "climate",
-            "what's",
-            "what is",
-            "how's",
-            "how is",
-            "the",
-            "in",
-            "at",
-            "for",
-            "today",
-            "tomorrow",
-            "like",
-        ]
-
-        # Clean the query
-        cleaned_query = query_lower
-        for word in weather_words:
-            cleaned_query = re.sub(rf"\b{word}\b", "", cleaned_query)
-
-        # Remove extra spaces and punctuation
-        cleaned_query = re.sub(r"[^\w\s]", "", cleaned_query)
+        # Remove common weather words, punctuation and extra spaces
+        cleaned_query = _PUNCT_RE.sub("", _WEATHER_WORDS_RE.sub("", query))
         cleaned_query = " ".join(cleaned_query.split())
 
-        if cleaned_query.strip():
-            return cleaned_query.strip().title()
+        if cleaned_query:
+            return cleaned_query.title()
 
         return None
 
@@ -295,6 +429,165 @@ Examples:
         """
         Get weather data from OpenWeather API using city name.
 
+        Args:
+            city: City name
+
+        Returns:
+            Weather data dictionary or None
+        """
+        city_key = city.lower()
+        cached = self._weather_cache.get(city_key)
+        if cached is not None:
+            return cached
+
+        city_id = self._city_ids.get(city_key)
+        if city_id is None:
+            # Only known ids can go through /group, so look up by name
+            weather_data = await self._fetch_weather_by_name(city)
+        else:
+            weather_data = await self._enqueue_batched(city_id, city)
+
+        if weather_data is not None:
+            self._weather_cache[city_key] = weather_data
+            if "id" in weather_data:
+                self._city_ids[city_key] = weather_data["id"]
+        return weather_data
+
+    async def _enqueue_batched(
+        self, city_id: int, city: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch now if nothing is in flight, else queue for the next /group.
+
+        Args:
+            city_id: OpenWeather city id
+            city: City name, used if the batched lookup misses
+
+        Returns:
+            Weather data dictionary or None
+        """
+        if not self._lookups_inflight and not self._batch:
+            # Nothing to batch with, so don't wait out the window
+            self._lookups_inflight += 1
+            try:
+                return await self._fetch_weather_by_name(city)
+            finally:
+                self._lookups_inflight -= 1
+
+        entry = self._batch.get(city_id)
+        if entry is None:
+            loop = asyncio.get_running_loop()
+            entry = (city, loop.create_future())
+            self._batch[city_id] = entry
+            if self._batch_handle is None:
+                self._batch_handle = loop.call_later(
+                    _BATCH_WINDOW, self._flush_batch
+                )
+
+        # Shield so one cancelled caller does not fail the others
+        return await asyncio.shield(entry[1])
+
+    def _flush_batch(self) -> None:
+        """Send the pending batch once the window closes."""
+        self._batch_handle = None
+        batch, self._batch = self._batch, {}
+        self._lookups_inflight += 1
+        task = asyncio.ensure_future(self._fetch_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _fetch_batch(
+        self, batch: Dict[int, Tuple[str, asyncio.Future]]
+    ) -> None:
+        """
+        Fetch weather for a batch and resolve its futures.
+
+        Args:
+            batch: Pending lookups keyed by city id
+        """
+        results: Dict[int, Optional[Dict[str, Any]]] = {}
+        try:
+            if len(batch) == 1:
+                # A lone lookup gains nothing from /group
+                ((city_id, (city, _)),) = batch.items()
+                results[city_id] = await self._fetch_weather_by_name(city)
+                return
+
+            ids = list(batch)
+            for chunk in await asyncio.gather(
+                *(
+                    self._fetch_group(ids[i : i + _GROUP_SIZE])
+                    for i in range(0, len(ids), _GROUP_SIZE)
+                )
+            ):
+                results.update(chunk)
+
+            # Anything /group did not return is retried by name
+            missing = [city_id for city_id in ids if city_id not in results]
+            if missing:
+                fallback = await asyncio.gather(
+                    *(
+                        self._fetch_weather_by_name(batch[city_id][0])
+                        for city_id in missing
+                    )
+                )
+                results.update(zip(missing, fallback))
+        finally:
+            self._lookups_inflight -= 1
+            for city_id, (_, future) in batch.items():
+                if not future.done():
+                    future.set_result(results.get(city_id))
+
+    async def _fetch_group(self, ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get weather data for several cities with one /group request.
+
+        Args:
+            ids: Up to 20 OpenWeather city ids
+
+        Returns:
+            Weather data keyed by city id; empty if the request fails
+        """
+        try:
+            params = {
+                "id": ",".join(map(str, ids)),
+                "appid": self.openweather_api_key,
+                "units": "metric",  # Use Celsius
+            }
+
+            response = await self.client.get(
+                f"{self.openweather_base_url}/group", params=params
+            )
+
+            if response.status_code != 200:
+                _LOGGER.warning(
+                    "OpenWeather group request failed: %s - %s",
+                    response.status_code,
+                    response.text,
+                    extra={
+                        "status_code": response.status_code,
+                        "event": "weather_group_error",
+                    },
+                )
+                return {}
+
+            data = orjson.loads(response.content)
+            return {entry["id"]: entry for entry in data.get("list", [])}
+
+        except Exception as e:
+            _LOGGER.warning(
+                "Weather group request failed: %s",
+                e,
+                extra={"error": str(e), "event": "weather_group_exception"},
+            )
+            return {}
+
+    async def _fetch_weather_by_name(
+        self, city: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get weather data for a single city from the /weather endpoint.
+
         Args:
             city: City name
 
@@ -313,21 +606,44 @@ Examples:
             )
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             elif response.status_code == 404:
-                print(f"City '{city}' not found")
+                _LOGGER.warning(
+                    "City not found: %s",
+                    city,
+                    extra={"location": city, "event": "city_not_found"},
+                )
                 return None
             elif response.status_code == 401:
-                print("OpenWeather API key invalid or not activated")
+                _LOGGER.warning(
+                    "OpenWeather API key invalid or not activated",
+                    extra={"event": "weather_api_unauthorized"},
+                )
                 return None
             else:
-                print(
-                    f"OpenWeather API error: {response.status_code} - {response.text}"
+                _LOGGER.warning(
+                    "OpenWeather API error: %s - %s",
+                    response.status_code,
+                    response.text,
+                    extra={
+                        "status_code": response.status_code,
+                        "body": response.text,
+                        "event": "weather_api_error",
+                    },
                 )
                 return None
 
         except Exception as e:
-            print(f"Weather API error: {e}")
+            _LOGGER.warning(
+                "Weather API request failed for %s: %s",
+                city,
+                e,
+                extra={
+                    "location": city,
+                    "error": str(e),
+                    "event": "weather_api_exception",
+                },
+            )
             return None
 
     async def _convert_to_natural_language(
@@ -345,103 +661,84 @@ Examples:
             Natural language weather response or None if LLM fails
         """
         try:
-            # Extract key weather information
-            temp = weather_data["main"]["temp"]
-            feels_like = weather_data["main"]["feels_like"]
-            humidity = weather_data["main"]["humidity"]
-            description = weather_data["weather"][0]["description"]
-            wind_speed = weather_data.get("wind", {}).get("speed", 0)
-            pressure = weather_data["main"].get("pressure")
+            main = weather_data["main"]
+            wind_speed = weather_data.get("wind", {}).get("speed")
             visibility = weather_data.get("visibility")
 
-            # Prepare the data for LLM
+            # Numeric values with units in the key names keep the prompt
+            # short; fields the API did not return are left out entirely
             weather_summary = {
-                "location": location,
-                "temperature": f"{temp:.1f}°C",
-                "feels_like": f"{feels_like:.1f}°C",
-                "conditions": description.title(),
-                "humidity": f"{humidity}%",
-                "wind_speed": f"{wind_speed} m/s",
-                "pressure": f"{pressure} hPa" if pressure else "N/A",
-                "visibility": (
-                    f"{visibility/1000:.1f} km" if visibility else "N/A"
+                "temp_c": main["temp"],
+                "feels_like_c": main["feels_like"],
+                "conditions": weather_data["weather"][0]["description"],
+                "humidity_pct": main["humidity"],
+                "wind_ms": wind_speed,
+                "pressure_hpa": main.get("pressure"),
+                "visibility_km": (
+                    round(visibility / 1000, 1) if visibility else None
                 ),
             }
+            weather_summary = {
+                k: v for k, v in weather_summary.items() if v is not None
+            }
 
             # Create LLM prompt for natural response
-            system_prompt = """You are a friendly weather assistant. Convert technical weather data into natural, conversational responses.
-
-Guidelines:
-1. Be conversational and human-like
-2. Answer the user's specific question if possible
-3. Include relevant details but don't overwhelm with data
-4. Use friendly language and appropriate tone
-5. Mention if conditions are good/bad for activities
-6. Keep it concise but informative
-7. Respond in JSON format: {"response": "your_natural_answer"}
-
-Examples:
-- For "What's the weather in Paris?": "It's quite pleasant in Paris right now! The temperature is 22°C with partly cloudy skies. Perfect weather for a stroll along the Seine!"
-- For "Is it raining in London?": "No rain in London at the moment! It's 18°C with overcast skies, so you might want to bring a light jacket just in case."
-- For "How hot is it in Dubai?": "It's pretty warm in Dubai today at 35°C, feeling like 38°C with the humidity. Definitely stay hydrated and stick to air-conditioned spaces!"
-"""
-
             user_prompt = f"""Original question: "{original_query}"
 Location: {location}
-Weather data: {weather_summary}
+Weather data: {orjson.dumps(weather_summary).decode()}
 
 Please provide a natural, conversational response to the user's weather question."""
 
-            # Call LLM
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.lm_studio_api_key}",
-            }
-
             payload = {
-                "model": self.lm_studio_model,
+                **self._nl_payload_base,
                 "messages": [
-                    {"role": "system", "content": system_prompt},
+                    _SYSTEM_MSG_NL,
                     {"role": "user", "content": user_prompt},
                 ],
-                "temperature": 0.7,  # Higher for more natural responses
-                "max_tokens": 200,
-                "stream": False,
             }
 
-            response = await self.llm_client.post(
-                f"{self.lm_studio_url}/chat/completions",
-                headers=headers,
-                json=payload,
+            llm_response = await self._response_llm_cache.cached(
+                cache_key(payload), lambda: self._chat(payload)
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                if (
-                    data.get("choices")
-                    and len(data["choices"]) > 0
-                    and data["choices"][0].get("message")
-                ):
+            # The prompt asks for bare text, so no JSON parsing is needed
+            return llm_response or None
 
-                    llm_response = data["choices"][0]["message"][
-                        "content"
-                    ].strip()
+        except Exception as e:
+            _LOGGER.warning(
+                "Natural language conversion error: %s",
+                e,
+                extra={
+                    "location": location,
+                    "error": str(e),
+                    "event": "natural_language_error",
+                },
+            )
+            return None
 
-                    # Parse JSON response
-                    import json
+    async def _chat(self, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Send a chat-completions request to LM Studio.
 
-                    try:
-                        response_data = json.loads(llm_response)
-                        return response_data.get("response", llm_response)
+        Args:
+            payload: The request payload
 
-                    except json.JSONDecodeError:
-                        # Fallback to raw response if JSON parsing fails
-                        return llm_response
+        Returns:
+            The stripped message content, or None if the call failed
+        """
+        response = await self.client.post(
+            self._llm_url,
+            headers=self._llm_headers,
+            content=orjson.dumps(payload),
+        )
 
+        if response.status_code != 200:
             return None
 
-        except Exception as e:
-            print(f"Error in natural language conversion: {e}")
+        data = orjson.loads(response.content)
+        try:
+            return data["choices"][0]["message"]["content"].strip()
+        except (KeyError, IndexError, TypeError, AttributeError):
             return None
 
     def _format_weather_response(
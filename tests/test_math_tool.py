@@ -0,0 +1,59 @@
+"""Tests for the math tool's local expression parsing."""
+
+import httpx
+import pytest
+
+from app.tools.math_tool import MathTool
+
+
+def make_tool(llm_calls):
+    """Build a MathTool whose LLM always answers "2**3+1"."""
+
+    def handler(request):
+        llm_calls.append(request)
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": "2**3+1"}}]}
+        )
+
+    transport = httpx.MockTransport(handler)
+    return MathTool(client=httpx.AsyncClient(transport=transport))
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("what is 5 plus 3?", "5 + 3"),
+        ("calculate 42 * 7", "42 * 7"),
+        ("What's 2 to the power of 8?", "2 ** 8"),
+        ("I need to calculate 15 + 27 for my homework", "15 + 27"),
+    ],
+)
+def test_local_parse(query, expected):
+    """Plain arithmetic wrapped in filler words is parsed locally."""
+    assert make_tool([])._rewrite_natural_language(query) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "sqrt(16) + 2",
+        "square root of 16 plus 9",
+        "log(100) - 1",
+        "what is 3.5e3 + 1",
+        "what is 2^3 + 1",
+        "5! + 1",
+        "3² + 1",
+        "√16 + 2",
+        "1,5 + 2",
+        "50% + 10",
+    ],
+)
+@pytest.mark.asyncio
+async def test_unparseable_queries_use_llm(query):
+    """Queries the local parser would mangle go to the LLM instead."""
+    llm_calls = []
+    tool = make_tool(llm_calls)
+
+    assert tool._rewrite_natural_language(query) == ""
+    assert await tool.execute(query) == "2**3+1 = 9"
+    assert len(llm_calls) == 1